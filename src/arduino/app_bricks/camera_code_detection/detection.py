@@ -154,8 +154,10 @@ class CameraCodeDetection:
             self._on_error(e)
             return
 
-        # Use grayscale for barcode/QR code detection
-        gs_frame = cv2.cvtColor(np.asarray(frame), cv2.COLOR_RGB2GRAY)
+        # Use grayscale for barcode/QR code detection. Converting on the PIL side means only the single luma plane is
+        # copied out to numpy, instead of materializing the full RGB array first and converting it afterwards. Frames
+        # that are already greyscale skip the conversion, which would otherwise be a plain copy.
+        gs_frame = np.asarray(frame if frame.mode == "L" else frame.convert("L"))
 
         self._on_frame(frame)
 
@@ -132,7 +132,8 @@ class VideoObjectDetection:
         """
         while self._is_running.is_set():
             try:
-                with connect(self._uri) as ws:
+                # Runner messages are small JSON payloads on a local link: permessage-deflate only costs CPU
+                with connect(self._uri, compression=None) as ws:
                     while self._is_running.is_set():
                         try:
                             message = ws.recv()
@@ -277,7 +278,7 @@ class VideoObjectDetection:
             TypeError: If the value is not a number.
             RuntimeError: If the model information is not available or does not support threshold override.
         """
-        with connect(self._uri) as ws:
+        with connect(self._uri, compression=None) as ws:
             self._override_threshold(ws, value)
 
     def _override_threshold(self, ws: ClientConnection, value: float):
@@ -403,8 +403,8 @@ class Speaker:
             if isinstance(data, bytes):
                 self._playing_queue.put(data, block=block_on_queue)
             elif isinstance(data, np.ndarray):
-                # Convert numpy array to bytes
-                data_bytes = data.astype(self._dtype).tobytes()
+                # Convert numpy array to bytes, tobytes() already copies so skip astype's copy when the dtype matches
+                data_bytes = data.astype(self._dtype, copy=False).tobytes()
                 self._playing_queue.put(data_bytes, block=block_on_queue)
             else:
                 raise TypeError("Audio data must be bytes or numpy array.")
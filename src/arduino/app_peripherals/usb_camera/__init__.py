@@ -6,6 +6,7 @@ import threading
 import time
 import cv2
 import io
+import numpy as np
 import os
 import re
 from PIL import Image
@@ -13,6 +14,9 @@ from arduino.app_utils import Logger
 
 logger = Logger("USB Camera")
 
+_BY_ID_INDEX_RE = re.compile(r"index(\d+)$")
+_LETTERBOX_FILL = 114  # Padding value on the color channels (yolo colors), alpha is padded with 0
+
 
 class CameraReadError(Exception):
     """Exception raised when the specified camera cannot be found."""
@@ -63,6 +67,7 @@ class USBCamera:
         self.letterbox = letterbox
         self._cap = None
         self._cap_lock = threading.Lock()
+        self._letterbox_local = threading.local()  # Per-thread letterbox canvas, see _letterbox
         self._last_capture_time_monotonic = time.monotonic()
         if self.fps > 0:
             self.desired_interval = 1.0 / self.fps
@@ -123,44 +128,67 @@ class USBCamera:
                 return None
 
         try:
-            if self.letterbox:
-                bgr_frame = self._letterbox(bgr_frame)
             if self.compression:
+                if self.letterbox:
+                    bgr_frame = self._letterbox(bgr_frame)
                 success, rgb_frame = cv2.imencode(".png", bgr_frame)
                 if success:
                     return rgb_frame
                 else:
                     return None
+            elif self.letterbox and bgr_frame.ndim == 3 and bgr_frame.shape[2] == 3:
+                # Convert straight into the letterbox canvas instead of padding first and converting afterwards. This
+                # only works when the conversion keeps the number of channels, e.g. not for BGRA frames.
+                return self._letterbox(bgr_frame, color_conversion=cv2.COLOR_BGR2RGB)
             else:
+                if self.letterbox:
+                    bgr_frame = self._letterbox(bgr_frame)
                 return cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB)
         except cv2.error as e:
             logger.exception(f"Error converting frame: {e}")
             return None
 
-    def _letterbox(self, frame: cv2.typing.MatLike) -> cv2.typing.MatLike:
+    def _letterbox(self, frame: cv2.typing.MatLike, color_conversion: int | None = None) -> cv2.typing.MatLike:
         """Applies letterboxing to the frame to make it square.
 
         Args:
             frame (cv2.typing.MatLike): The input frame to be letterboxed (as cv2 supported format - numpy like).
+            color_conversion (int | None): Optional cv2.COLOR_* code applied while copying the frame into the padded
+                canvas. It must preserve the number of channels.
 
         Returns:
-            cv2.typing.MatLike: The letterboxed frame (as cv2 supported format - numpy like).
+            cv2.typing.MatLike: The letterboxed frame (as cv2 supported format - numpy like). The returned buffer is
+            reused by the next call on the same thread.
         """
         h, w = frame.shape[:2]
-        if w != h:
-            # Letterbox: add padding to make it square (yolo colors)
+        if w == h:
+            return frame if color_conversion is None else cv2.cvtColor(frame, color_conversion)
+
+        # The padding is the same for every frame of a given shape, so the canvas is filled once and then only its
+        # interior is overwritten. The padding geometry is resolved together with the canvas, keeping the per-frame
+        # work down to the copy itself. It's kept per thread as captures can run concurrently outside of _cap_lock,
+        # and it's safe to reuse because every caller copies or encodes the result before handing it out.
+        local = self._letterbox_local
+        key = (frame.shape, frame.dtype)
+        if getattr(local, "key", None) != key:
+            # Letterbox: add padding to make it square
             size = max(h, w)
-            return cv2.copyMakeBorder(
-                frame,
-                top=(size - h) // 2,
-                bottom=(size - h + 1) // 2,
-                left=(size - w) // 2,
-                right=(size - w + 1) // 2,
-                borderType=cv2.BORDER_CONSTANT,
-                value=(114, 114, 114),
-            )
+            top = (size - h) // 2
+            left = (size - w) // 2
+            local.canvas = np.full((size, size, *frame.shape[2:]), _LETTERBOX_FILL, dtype=frame.dtype)
+            if local.canvas.ndim == 3:
+                # Like the (114, 114, 114) scalar of cv2.copyMakeBorder, channels past the third (alpha) are padded with 0
+                local.canvas[..., 3:] = 0
+            local.interior = local.canvas[top : top + h, left : left + w]
+            local.key = key
+
+        interior = local.interior
+        if color_conversion is None:
+            interior[...] = frame
         else:
-            return frame
+            # The padding is neutral grey, so a channel reordering conversion leaves it unchanged
+            cv2.cvtColor(frame, color_conversion, dst=interior)
+        return local.canvas
 
     def _get_video_devices_by_index(self):
         """Reads symbolic links in /dev/v4l/by-id/, resolves them, and returns a
@@ -179,36 +207,39 @@ class USBCamera:
             return devices_by_index
 
         try:
-            # List all entries in the directory
-            entries = os.listdir(directory_path)
+            # A single scandir pass: DirEntry caches the symlink flag, so each entry costs one readlink at most
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    # Check if the entry is a symbolic link
+                    if not entry.is_symlink():
+                        continue
 
-            for entry in entries:
-                full_path = os.path.join(directory_path, entry)
-
-                # Check if the entry is a symbolic link
-                if os.path.islink(full_path):
                     # Use a regular expression to find the numeric index at the end of the filename
-                    match = re.search(r"index(\d+)$", entry)
-                    if match:
-                        index_str = match.group(1)
-                        try:
-                            index = int(index_str)
-
-                            # Resolve the symbolic link to its absolute path
-                            resolved_path = os.path.realpath(full_path)
-
-                            # Get just the filename (e.g., "video0") from the resolved path
-                            device_name = os.path.basename(resolved_path)
-
-                            # Remove the "video" prefix to get just the number
-                            device_number = device_name.replace("video", "")
-
-                            # Add the index and device number to the dictionary
-                            devices_by_index[index] = device_number
-
-                        except ValueError:
-                            logger.warning(f"Warning: Could not convert index '{index_str}' to an integer for '{entry}'. Skipping.")
-                            continue
+                    match = _BY_ID_INDEX_RE.search(entry.name)
+                    if not match:
+                        continue
+
+                    index_str = match.group(1)
+                    try:
+                        index = int(index_str)
+
+                        # by-id links point straight at the device node (e.g. "../../video0"), so reading the link
+                        # itself is enough to get the device name, no need to resolve the full path
+                        device_name = os.path.basename(os.readlink(entry.path))
+
+                        # Remove the "video" prefix to get just the number
+                        device_number = device_name.replace("video", "")
+
+                        # Add the index and device number to the dictionary
+                        devices_by_index[index] = device_number
+
+                    except ValueError:
+                        logger.warning(f"Warning: Could not convert index '{index_str}' to an integer for '{entry.name}'. Skipping.")
+                        continue
+                    except OSError as e:
+                        # The link can disappear between scandir and readlink, e.g. when the camera is unplugged
+                        logger.warning(f"Warning: Could not read link '{entry.path}': {e}. Skipping.")
+                        continue
         except OSError as e:
             logger.error(f"Error accessing directory '{directory_path}': {e}")
             return devices_by_index
@@ -280,6 +280,8 @@ class ClientServer(metaclass=SingletonMeta):
         self.callbacks_lock = threading.Lock()
         self.handlers = {}  # method name -> function
         self.handlers_lock = threading.Lock()
+        # RPC message type -> handler, resolved once here instead of comparing the type on every message
+        self._msg_handlers = {0: self._handle_request, 1: self._handle_response, 2: self._handle_notification}
 
         address_config = os.environ.get("APP_SOCKET", address)
         urlparsed = urlparse(address_config)
@@ -499,10 +501,11 @@ class ClientServer(metaclass=SingletonMeta):
     # TODO: verify if this is still needed
     def _decode_method(self, method_name: any) -> str:
         """Decodes the method name from bytes to string if necessary."""
-        if isinstance(method_name, bytes):
-            return method_name.decode()
+        # The unpacker already decodes msgpack strings, so str is the common case and is checked first
         if isinstance(method_name, str):
             return method_name
+        if isinstance(method_name, bytes):
+            return method_name.decode()
         else:
             raise ValueError(f"Invalid method name type: {type(method_name)}. Expected str or bytes.")
 
@@ -514,77 +517,88 @@ class ClientServer(metaclass=SingletonMeta):
 
         msg_type = msg[0]
         try:
-            if msg_type == 0:  # Request: [0, msgid, method, params]
-                if len(msg) != 4:
-                    raise ValueError("Invalid RPC request: expected length 4")
-                _, msgid, method, params = msg
-                if not isinstance(params, (list, tuple)):
-                    raise ValueError("Invalid RPC request params: expected array/tuple")
+            handle = self._msg_handlers.get(msg_type)
+        except TypeError:  # Unhashable type, it can't be a valid one anyway
+            handle = None
 
-                method_name = self._decode_method(method)
+        try:
+            if handle:
+                handle(msg)
+            else:
+                logger.warning(f"Invalid RPC message type received: {msg_type}")
+
+        except ValueError as ve:
+            logger.error(f"Message validation error: {ve}")
+        except Exception as e:
+            logger.error(f"Unexpected error while handling message: {e}")
 
-                with self.handlers_lock:
-                    handler = self.handlers.get(method_name)
+    def _handle_request(self, msg: list):
+        """Processes a request message: [0, msgid, method, params]."""
+        if len(msg) != 4:
+            raise ValueError("Invalid RPC request: expected length 4")
+        _, msgid, method, params = msg
+        if not isinstance(params, (list, tuple)):
+            raise ValueError("Invalid RPC request params: expected array/tuple")
 
-                if handler:
-                    try:
-                        result = handler(*params)  # Unpack params
-                        self._send_response(msgid, None, result)
-                    except Exception as e:
-                        logger.error(f"Failed to run user-provided call handler for method '{method_name}': {e}")
-                        self._send_response(msgid, e, None)
-                else:
-                    self._send_response(msgid, NameError(f"Method not found: '{method_name}'", method_name), None)
-
-            elif msg_type == 1:  # Response: [1, msgid, error, result]
-                if len(msg) != 4:
-                    raise ValueError("Invalid RPC response: expected length 4")
-                _, msgid, error, result = msg
-                if error and (not isinstance(error, list) or len(error) < 2):
-                    raise ValueError("Invalid error format in RPC response")
-
-                with self.callbacks_lock:
-                    cbs = self.callbacks.pop(msgid, None)
-                if cbs:
-                    on_result, on_error = cbs
-                    if result is None and error is None:
-                        on_result(None)
-                    else:
-                        # Treat ROUTE_ALREADY_EXISTS_ERR error as OK. It only means that the router already knows about the
-                        # method and registering it is not necessary. It's an internal and recoverable situation.
-                        if result is not None or (error is not None and error[0] == ROUTE_ALREADY_EXISTS_ERR):
-                            on_result(result)
-                        elif error is not None:
-                            on_error(error)
-                        else:
-                            on_result([GENERIC_ERR, "Unknown error occurred."])
-                else:
-                    on_error([GENERIC_ERR, f"Response for unknown msgid {msgid} received."])
+        method_name = self._decode_method(method)
 
-            elif msg_type == 2:  # Notification: [2, method, params]
-                if len(msg) != 3:
-                    raise ValueError("Invalid RPC notification: expected length 3")
-                _, method, params = msg
-                if not isinstance(params, (list, tuple)):
-                    raise ValueError("Invalid RPC notification params: expected array or tuple")
+        with self.handlers_lock:
+            handler = self.handlers.get(method_name)
 
-                method_name = self._decode_method(method)
+        if handler:
+            try:
+                result = handler(*params)  # Unpack params
+                self._send_response(msgid, None, result)
+            except Exception as e:
+                logger.error(f"Failed to run user-provided call handler for method '{method_name}': {e}")
+                self._send_response(msgid, e, None)
+        else:
+            self._send_response(msgid, NameError(f"Method not found: '{method_name}'", method_name), None)
 
-                with self.handlers_lock:
-                    handler = self.handlers.get(method_name)
+    def _handle_response(self, msg: list):
+        """Processes a response message: [1, msgid, error, result]."""
+        if len(msg) != 4:
+            raise ValueError("Invalid RPC response: expected length 4")
+        _, msgid, error, result = msg
+        if error and (not isinstance(error, list) or len(error) < 2):
+            raise ValueError("Invalid error format in RPC response")
 
-                if handler:
-                    try:
-                        handler(*params)
-                    except Exception as e:
-                        logger.error(f"Failed to run user-provided notification handler for method '{method_name}': {e}")
+        with self.callbacks_lock:
+            cbs = self.callbacks.pop(msgid, None)
+        if cbs:
+            on_result, on_error = cbs
+            if result is None and error is None:
+                on_result(None)
             else:
-                logger.warning(f"Invalid RPC message type received: {msg_type}")
+                # Treat ROUTE_ALREADY_EXISTS_ERR error as OK. It only means that the router already knows about the
+                # method and registering it is not necessary. It's an internal and recoverable situation.
+                if result is not None or (error is not None and error[0] == ROUTE_ALREADY_EXISTS_ERR):
+                    on_result(result)
+                elif error is not None:
+                    on_error(error)
+                else:
+                    on_result([GENERIC_ERR, "Unknown error occurred."])
+        else:
+            on_error([GENERIC_ERR, f"Response for unknown msgid {msgid} received."])
 
-        except ValueError as ve:
-            logger.error(f"Message validation error: {ve}")
-        except Exception as e:
-            logger.error(f"Unexpected error while handling message: {e}")
+    def _handle_notification(self, msg: list):
+        """Processes a notification message: [2, method, params]."""
+        if len(msg) != 3:
+            raise ValueError("Invalid RPC notification: expected length 3")
+        _, method, params = msg
+        if not isinstance(params, (list, tuple)):
+            raise ValueError("Invalid RPC notification params: expected array or tuple")
+
+        method_name = self._decode_method(method)
+
+        with self.handlers_lock:
+            handler = self.handlers.get(method_name)
+
+        if handler:
+            try:
+                handler(*params)
+            except Exception as e:
+                logger.error(f"Failed to run user-provided notification handler for method '{method_name}': {e}")
 
     def _fail_pending_callbacks(self, reason: Exception):
         """Invokes error callbacks for all pending requests and clears their callbacks."""
@@ -164,14 +164,16 @@ def draw_bounding_boxes(image: Image.Image | bytes, detection: dict, draw: Image
 
         # Draw bounding box
         draw.rectangle([x1, y1, x2, y2], outline=box_color, width=box_thickness)
-        # Draw label background (dark gray, semi-transparent) on overlay
+        if image_box.mode != "RGBA" or image_box is image:
+            # Convert (and so copy) the image only once, the label backgrounds are then blended into it in place
+            image_box = image_box.convert("RGBA")
+            draw = ImageDraw.Draw(image_box)
+        # Draw label background (dark gray, semi-transparent), blending only the label area instead of a full-size overlay
         label_bg_color = (0, 0, 0, 128)
-        overlay = Image.new("RGBA", image_box.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-        overlay_draw.rectangle([x1, y1_text, x2_text, y2_text], fill=label_bg_color, outline=None)
-        image_box = image_box.convert("RGBA")
-        image_box = Image.alpha_composite(image_box, overlay)
-        draw = ImageDraw.Draw(image_box)
+        label_x1, label_y1 = max(x1, 0), max(y1_text, 0)
+        if label_x1 <= x2_text and label_y1 <= y2_text:
+            label_bg = Image.new("RGBA", (x2_text - label_x1 + 1, y2_text - label_y1 + 1), label_bg_color)
+            image_box.alpha_composite(label_bg, dest=(label_x1, label_y1))
         # Draw label text (same color as box, with padding)
         draw.text((x1 + label_hpad, y1_text + label_vpad), text, fill=box_color, font=font)
 
@@ -236,13 +238,21 @@ def draw_anomaly_markers(
         outline_color = (0, 0, 0)
         fill_color_with_alpha = base_color_rgb + (alpha,)
 
-        temp_layer = Image.new("RGBA", image_box.size, (0, 0, 0, 0))
-        temp_draw = ImageDraw.Draw(temp_layer)
+        if image_box is image:
+            # Never blend into the caller's image, copy it once and then blend every marker into the copy in place
+            image_box = image_box.copy()
 
-        temp_draw.rectangle([x1, y1, x2, y2], fill=fill_color_with_alpha)
-        temp_draw.rectangle([x1, y1, x2, y2], outline=outline_color, width=box_thickness)
-        image_box = Image.alpha_composite(image_box, temp_layer)
+        # The layer only spans the marker instead of the whole image. It's padded by the outline width, which PIL can
+        # draw past the box edges on degenerate boxes, and clipped to the image on every side so that it is never
+        # larger than the image itself. Markers entirely outside of the image get an empty layer and are skipped.
+        left, top = max(x1 - box_thickness, 0), max(y1 - box_thickness, 0)
+        right, bottom = min(x2 + box_thickness, image_box.width - 1), min(y2 + box_thickness, image_box.height - 1)
+        temp_layer = Image.new("RGBA", (max(right - left + 1, 0), max(bottom - top + 1, 0)), (0, 0, 0, 0))
+        temp_draw = ImageDraw.Draw(temp_layer)
 
-        draw = ImageDraw.Draw(image_box)
+        temp_draw.rectangle([x1 - left, y1 - top, x2 - left, y2 - top], fill=fill_color_with_alpha)
+        temp_draw.rectangle([x1 - left, y1 - top, x2 - left, y2 - top], outline=outline_color, width=box_thickness)
+        if temp_layer.width > 0 and temp_layer.height > 0:
+            image_box.alpha_composite(temp_layer, dest=(left, top))
 
     return image_box
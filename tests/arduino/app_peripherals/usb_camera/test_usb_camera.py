@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (C) 2025 ARDUINO SA <http://www.arduino.cc>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import cv2
+import numpy as np
+import pytest
+from unittest.mock import patch, MagicMock
+from arduino.app_peripherals.usb_camera import USBCamera
+
+# (height, width, channels), channels None for single channel 2D frames
+FRAME_SHAPES = [
+    (4, 8, 3),  # Landscape, even padding
+    (5, 8, 3),  # Landscape, odd padding
+    (9, 4, 3),  # Portrait, even padding
+    (8, 3, 3),  # Portrait, odd padding
+    (6, 6, 3),  # Square, no padding
+    (5, 8, 4),  # BGRA
+    (9, 4, 4),  # BGRA portrait
+    (6, 6, 4),  # BGRA square
+    (5, 8, None),  # Grayscale
+]
+
+
+def _frame(shape: tuple[int, int, int | None]) -> np.ndarray:
+    h, w, c = shape
+    size = h * w * (c or 1)
+    return (np.arange(size, dtype=np.uint32) % 251).astype(np.uint8).reshape((h, w) if c is None else (h, w, c))
+
+
+def _reference_letterbox(frame: np.ndarray) -> np.ndarray:
+    """Letterboxing as done before the per-thread canvas was introduced."""
+    h, w = frame.shape[:2]
+    if w == h:
+        return frame
+    size = max(h, w)
+    return cv2.copyMakeBorder(
+        frame,
+        top=(size - h) // 2,
+        bottom=(size - h + 1) // 2,
+        left=(size - w) // 2,
+        right=(size - w + 1) // 2,
+        borderType=cv2.BORDER_CONSTANT,
+        value=(114, 114, 114),
+    )
+
+
+@pytest.fixture
+def camera():
+    """Provides a letterboxing USBCamera backed by a mocked capture device."""
+    with patch.object(USBCamera, "_get_video_devices_by_index", return_value={0: "0"}):
+        cam = USBCamera(camera=0, fps=0, letterbox=True)
+    cam._cap = MagicMock()
+    return cam
+
+
+@pytest.mark.parametrize("shape", FRAME_SHAPES)
+def test_letterbox_matches_copy_make_border(camera, shape):
+    """Test that the letterboxed frame matches the cv2.copyMakeBorder output."""
+    frame = _frame(shape)
+    result = camera._letterbox(frame)
+    np.testing.assert_array_equal(result, _reference_letterbox(frame))
+
+
+@pytest.mark.parametrize("shape", [s for s in FRAME_SHAPES if s[2] is not None])
+def test_capture_letterbox_rgb_matches_reference(camera, shape):
+    """Test that an uncompressed letterboxed capture matches letterboxing first and converting to RGB afterwards."""
+    frame = _frame(shape)
+    camera._cap.read.return_value = (True, frame)
+
+    expected = cv2.cvtColor(_reference_letterbox(frame), cv2.COLOR_BGR2RGB)
+    # Twice, so that the second capture reuses the cached canvas
+    for _ in range(2):
+        result = camera._extract_frame()
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_capture_letterbox_keeps_frames_independent(camera):
+    """Test that a captured image is not changed by the next capture reusing the letterbox canvas."""
+    first, second = _frame((5, 8, 3)), 255 - _frame((5, 8, 3))
+    camera._cap.read.side_effect = [(True, first), (True, second)]
+
+    first_image = camera.capture()
+    expected = first_image.copy()
+    camera.capture()
+
+    np.testing.assert_array_equal(np.asarray(first_image), np.asarray(expected))
+    np.testing.assert_array_equal(np.asarray(first_image), cv2.cvtColor(_reference_letterbox(first), cv2.COLOR_BGR2RGB))
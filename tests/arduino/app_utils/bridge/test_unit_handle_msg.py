@@ -2,19 +2,31 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 from arduino.app_utils.bridge import ClientServer, ROUTE_ALREADY_EXISTS_ERR, GENERIC_ERR
 from test_unit_common import UnitTest
 
 
+class _Recorder:
+    """Minimal stand-in for ClientServer._send_response that only records the calls it receives."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args):
+        self.calls.append(args)
+
+
 class TestHandleMsg(UnitTest):
     def test_handle_msg_request(self):
         """Test handling of an incoming request message."""
         client = ClientServer()
-        client._send_response = MagicMock()
+        client._send_response = _Recorder()
 
-        handler_mock = MagicMock(return_value="handled")
+        handler_mock = Mock(return_value="handled")
         method_name = "provided_method"
         client.handlers[method_name] = handler_mock
 
@@ -25,19 +37,19 @@ class TestHandleMsg(UnitTest):
         client._handle_msg(request_msg)
 
         handler_mock.assert_called_once_with(*params)
-        client._send_response.assert_called_once_with(msgid, None, "handled")
+        self.assertEqual(client._send_response.calls, [(msgid, None, "handled")])
 
     def test_handle_msg_request_method_not_found(self):
         """Test handling of a request for a method that is not found."""
         client = ClientServer()
-        client._send_response = MagicMock()
+        client._send_response = _Recorder()
 
         request_msg = [0, 456, "unknown_method", []]
 
         client._handle_msg(request_msg)
 
-        client._send_response.assert_called_once()
-        args, _ = client._send_response.call_args
+        self.assertEqual(len(client._send_response.calls), 1)
+        args = client._send_response.calls[0]
         self.assertEqual(args[0], 456)  # msgid
         self.assertIsInstance(args[1], NameError)  # error
         self.assertIsNone(args[2])  # result
@@ -45,9 +57,9 @@ class TestHandleMsg(UnitTest):
     def test_handle_msg_notification(self):
         """Test handling of an incoming notification message."""
         client = ClientServer()
-        client._send_response = MagicMock()
+        client._send_response = _Recorder()
 
-        handler_mock = MagicMock()
+        handler_mock = Mock()
         method_name = "notification_handler"
         client.handlers[method_name] = handler_mock
 
@@ -57,7 +69,7 @@ class TestHandleMsg(UnitTest):
         client._handle_msg(notification_msg)
 
         handler_mock.assert_called_once_with(*params)
-        client._send_response.assert_not_called()  # Notifications don't get responses
+        self.assertEqual(client._send_response.calls, [])  # Notifications don't get responses
 
     def test_handle_msg_response(self):
         """Test handling of an incoming response message."""
@@ -67,8 +79,8 @@ class TestHandleMsg(UnitTest):
         result_data = {"status": "ok"}
 
         # Mock the callbacks
-        on_result_mock = MagicMock()
-        on_error_mock = MagicMock()
+        on_result_mock = Mock()
+        on_error_mock = Mock()
         client.callbacks[msgid] = (on_result_mock, on_error_mock)
 
         response_msg = [1, msgid, None, result_data]
@@ -88,8 +100,8 @@ class TestHandleMsg(UnitTest):
         result_error = [GENERIC_ERR, "Some generic error occurred"]
 
         # Mock the callbacks
-        on_result_mock = MagicMock()
-        on_error_mock = MagicMock()
+        on_result_mock = Mock()
+        on_error_mock = Mock()
         client.callbacks[msgid] = (on_result_mock, on_error_mock)
 
         response_msg = [1, msgid, result_error, result_data]
@@ -109,8 +121,8 @@ class TestHandleMsg(UnitTest):
         result_error = [ROUTE_ALREADY_EXISTS_ERR, "Method already exists"]
 
         # Mock the callbacks
-        on_result_mock = MagicMock()
-        on_error_mock = MagicMock()
+        on_result_mock = Mock()
+        on_error_mock = Mock()
         client.callbacks[msgid] = (on_result_mock, on_error_mock)
 
         response_msg = [1, msgid, result_error, result_data]
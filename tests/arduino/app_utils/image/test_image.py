@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: Copyright (C) 2025 ARDUINO SA <http://www.arduino.cc>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from arduino.app_utils.image import FONT_PATH, draw_anomaly_markers, draw_bounding_boxes, get_box_color
+
+
+def _reference_markers(image: Image.Image, boxes: list, alpha: int) -> Image.Image:
+    """Blend the markers through full-size overlays, the straightforward way draw_anomaly_markers is expected to match."""
+    image_box = image.convert("RGBA")
+    box_thickness = max(1, int(max(image_box.size) / 400))
+    for box in boxes:
+        overlay = Image.new("RGBA", image_box.size, (0, 0, 0, 0))
+        overlay_draw = ImageDraw.Draw(overlay)
+        overlay_draw.rectangle(box, fill=(255, 0, 0, alpha))
+        overlay_draw.rectangle(box, outline=(0, 0, 0), width=box_thickness)
+        image_box = Image.alpha_composite(image_box, overlay)
+    return image_box
+
+
+@pytest.mark.parametrize(
+    "box",
+    [
+        [10, 10, 30000, 30000],  # Runs far past the right and bottom edges
+        [-500, -500, 30000, 30000],  # Covers the whole image
+        [300, 200, 400, 300],  # Partially outside
+        [400, 10, 500, 20],  # Entirely to the right of the image
+        [10, 300, 20, 400],  # Entirely below the image
+    ],
+)
+def test_draw_anomaly_markers_out_of_bounds_box(box):
+    """Markers that exceed the image are clipped to it and blended exactly like a full-size overlay would be."""
+    img = Image.new("RGB", (320, 240), color="white")
+    det = {"anomaly_max_score": 2.0, "detection": [{"class_name": "a", "bounding_box_xyxy": box, "score": 1.0}]}
+
+    out = draw_anomaly_markers(img, det)
+
+    assert isinstance(out, Image.Image)
+    assert out.size == img.size
+    assert np.array_equal(np.asarray(out), np.asarray(_reference_markers(img, [box], alpha=127)))
+    assert np.array_equal(np.asarray(img), np.full((240, 320, 3), 255, dtype=np.uint8))  # Input is left untouched
+
+
+def _reference_bounding_boxes(image: Image.Image, detections: list) -> Image.Image:
+    """Blend the label backgrounds through full-size overlays, the straightforward way draw_bounding_boxes is expected to
+    match."""
+    image_box = image.copy()
+    draw = ImageDraw.Draw(image_box)
+    ref_dim = max(image_box.size)
+    font_size = max(8, int(ref_dim / (28 + max(1, len(detections)) * 3)))
+    box_thickness = max(1, int(ref_dim / 250))
+    label_vpad = max(2, int(font_size * 0.4))
+    label_hpad = max(4, int(font_size * 0.8))
+    try:
+        font = ImageFont.truetype(FONT_PATH, font_size)
+    except Exception:
+        font = ImageFont.load_default(14)
+
+    for obj_det in detections:
+        x1, y1, x2, y2 = (int(v) for v in obj_det["bounding_box_xyxy"])
+        confid = float(obj_det["confidence"])
+        box_color = get_box_color(confid)
+        text = f"{obj_det['class_name'].capitalize()} {confid:.1f}%"
+        text_width, text_height = font.getbbox(text)[2:]
+        label_gap = max(1, int(font_size * 0.15))
+        y1_text = y1 - text_height - label_vpad * 2 - label_gap
+        if y1_text < 0:
+            y1_text = y1 + label_gap
+        y2_text = y1_text + text_height + label_vpad * 2
+        x2_text = x1 + text_width + label_hpad * 2
+
+        draw.rectangle([x1, y1, x2, y2], outline=box_color, width=box_thickness)
+        overlay = Image.new("RGBA", image_box.size, (0, 0, 0, 0))
+        ImageDraw.Draw(overlay).rectangle([x1, y1_text, x2_text, y2_text], fill=(0, 0, 0, 128), outline=None)
+        image_box = Image.alpha_composite(image_box.convert("RGBA"), overlay)
+        draw = ImageDraw.Draw(image_box)
+        draw.text((x1 + label_hpad, y1_text + label_vpad), text, fill=box_color, font=font)
+    return image_box
+
+
+def _gradient_image(mode: str) -> Image.Image:
+    """A 320x240 image with distinct pixel values, so that blending mistakes show up."""
+    y, x = np.mgrid[0:240, 0:320]
+    channels = [x % 256, y % 256, (x + y) % 256]
+    if mode == "RGBA":
+        channels.append(64 + (x * 3 + y) % 192)  # Varying, never fully transparent alpha
+    return Image.fromarray(np.stack(channels, axis=-1).astype(np.uint8))
+
+
+def _detections(boxes: list) -> list:
+    return [{"class_name": f"object{i}", "bounding_box_xyxy": box, "confidence": 95.0 - i * 30} for i, box in enumerate(boxes)]
+
+
+def _no_label_background_blended(image: Image.Image, original: Image.Image, detections: list) -> bool:
+    """Whether no label background was blended into the caller's image, i.e. every changed pixel has a box color."""
+    changed = np.asarray(image)[np.any(np.asarray(image) != np.asarray(original), axis=-1)][:, :3]
+    box_colors = np.array([ImageColor.getrgb(get_box_color(float(obj_det["confidence"]))) for obj_det in detections])
+    return bool(np.all(np.any(np.all(changed[:, None, :] == box_colors[None, :, :], axis=-1), axis=1)))
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA"])
+@pytest.mark.parametrize(
+    "boxes",
+    [
+        [[40, 60, 200, 180]],  # Label above the box
+        [[-30, -20, 100, 80]],  # Label clipped at the top and left edges
+        [[-30, 40, 100, 120]],  # Label clipped at the left edge only
+        [[250, 200, 400, 300]],  # Box and label past the right and bottom edges
+        [[280, 230, 30000, 30000]],  # Box far past the right and bottom edges
+        [[10, 40, 120, 140], [60, 60, 200, 180], [-5, -5, 330, 250]],  # Overlapping labels
+    ],
+)
+def test_draw_bounding_boxes_matches_full_size_overlay(mode, boxes):
+    """Label backgrounds are blended exactly like full-size overlays would be, and never into the input image."""
+    img = _gradient_image(mode)
+    original = img.copy()
+    detections = _detections(boxes)
+
+    out = draw_bounding_boxes(img, {"detection": detections})
+
+    assert isinstance(out, Image.Image)
+    assert out.mode == "RGBA"
+    assert out.size == img.size
+    assert out is not img
+    assert np.array_equal(np.asarray(out), np.asarray(_reference_bounding_boxes(original, detections)))
+    assert _no_label_background_blended(img, original, detections)
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA"])
+def test_draw_bounding_boxes_bytes_input(mode):
+    """Encoded images are decoded and drawn on like PIL images."""
+    original = _gradient_image(mode)
+    buffer = io.BytesIO()
+    original.save(buffer, "PNG")
+    detections = _detections([[-30, -20, 100, 80], [250, 200, 400, 300]])
+
+    out = draw_bounding_boxes(buffer.getvalue(), {"detection": detections})
+
+    assert isinstance(out, Image.Image)
+    assert np.array_equal(np.asarray(out), np.asarray(_reference_bounding_boxes(original, detections)))